@@ -1,8 +1,12 @@
 from fastapi import HTTPException, status
-from sqlalchemy import select, func
+from sqlalchemy import Select, select, func, delete, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from core.models import Task
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta, timezone
+import uuid
+from core.config import settings
+from core.models import Task, TaskTombstone
 from core.models.task import TaskStatus
 
 from .schemas import (
@@ -11,6 +15,9 @@ from .schemas import (
     TaskUpdate,
     TaskUpdatePartial,
     TasksResponseSchema,
+    TaskChangeOp,
+    TaskChangeSchema,
+    TaskChangesResponseSchema,
 )
 import logging.config
 from core.logger import logger_config
@@ -18,27 +25,72 @@ from core.logger import logger_config
 logging.config.dictConfig(logger_config)
 logger = logging.getLogger('crud_logger')
 
+
+def encode_sync_token(changed_at: datetime, task_id: uuid.UUID) -> str:
+    raw = f'{changed_at.isoformat()}|{task_id}'.encode()
+    return urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_sync_token(token: str) -> tuple[datetime, uuid.UUID]:
+    """
+    Разбирает токен синхронизации в позицию (время изменения, ID).
+
+    raises HTTPException: Если токен поврежден.
+    """
+    try:
+        raw = urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+        changed_at, task_id = raw.split('|')
+        return datetime.fromisoformat(changed_at), uuid.UUID(task_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный токен синхронизации',
+        )
+
 class TaskCRUD:
     
     @classmethod
     async def get_task(
         cls,
         session: AsyncSession,
-        task_id: int,
+        task_id: uuid.UUID | str,
     ) -> Task | None:
+        if not isinstance(task_id, uuid.UUID):
+            # ID, который не является UUID, не может существовать в базе
+            try:
+                task_id = uuid.UUID(task_id)
+            except ValueError:
+                return None
         return await session.get(Task, task_id)
     
     @classmethod
-    async def get_tasks(
+    async def warmup(
         cls,
         session: AsyncSession,
+    ) -> None:
+        """
+        Выполняет горячие запросы (получение по ID и первая страница списка),
+        чтобы они были подготовлены на соединении до первых запросов клиентов.
+        """
+        await cls.get_task(session=session, task_id=uuid.uuid4())
+        await cls.get_tasks(session=session)
+
+    @classmethod
+    def build_tasks_statements(
+        cls,
         column: str = 'title',
         sort: str = 'desc',
         page: int = 1,
         limit: int = 10,
         column_search: str | None = None,
         input_search: str | None = None,
-    ) -> TasksResponseSchema:
+    ) -> tuple[Select, Select]:
+        """
+        Строит запрос страницы задач и запрос их общего количества.
+
+        return: Кортеж (запрос страницы, запрос количества).
+        raises ValueError: Если передан неизвестный статус задачи.
+        """
         stmt = select(Task)
         total_stmt = select(func.count(Task.id))
 
@@ -50,20 +102,17 @@ class TaskCRUD:
 
             elif column_search == 'status':
                 if input_search.upper() == 'CREATED':
-                    stmt = stmt.where(Task.status == TaskStatus.CREATED)
+                    condition = Task.status == TaskStatus.CREATED
                 elif input_search.upper() == 'IN_PROGRESS':
-                    stmt = stmt.where(Task.status == TaskStatus.IN_PROGRESS)
+                    condition = Task.status == TaskStatus.IN_PROGRESS
                 elif input_search.upper() == 'COMPLETED':
-                    stmt = stmt.where(Task.status == TaskStatus.COMPLETED)
+                    condition = Task.status == TaskStatus.COMPLETED
                 else:
                     logger.exception('Неизвестный статус задачи: %s', input_search)
                     raise ValueError(f'Неизвестный статус задачи: {input_search}')
+                stmt = stmt.where(condition)
+                total_stmt = total_stmt.where(condition)
 
-        total_result = await session.execute(total_stmt)
-        total_tasks = total_result.scalar() or 0
-
-        # Вычисляем количество страниц
-        pages_count = (total_tasks + limit - 1) // limit  # Округление вверх
         # Добавляем пагинацию к запросу
         offset = (page - 1) * limit
 
@@ -72,6 +121,33 @@ class TaskCRUD:
         ordering = task_column.desc() if sort.lower() == 'desc' else task_column.asc()
         # строим запрос с сортировкой, лимитом и offset
         stmt = stmt.order_by(ordering).limit(limit).offset(offset)
+        return stmt, total_stmt
+
+    @classmethod
+    async def get_tasks(
+        cls,
+        session: AsyncSession,
+        column: str = 'title',
+        sort: str = 'desc',
+        page: int = 1,
+        limit: int = 10,
+        column_search: str | None = None,
+        input_search: str | None = None,
+    ) -> TasksResponseSchema:
+        stmt, total_stmt = cls.build_tasks_statements(
+            column=column,
+            sort=sort,
+            page=page,
+            limit=limit,
+            column_search=column_search,
+            input_search=input_search,
+        )
+
+        total_result = await session.execute(total_stmt)
+        total_tasks = total_result.scalar() or 0
+
+        # Вычисляем количество страниц
+        pages_count = (total_tasks + limit - 1) // limit  # Округление вверх
 
         result = await session.execute(stmt)
         tasks = result.scalars().all()
@@ -83,6 +159,104 @@ class TaskCRUD:
             tasks=tasks,
         )
 
+    @classmethod
+    async def get_changes(
+        cls,
+        session: AsyncSession,
+        since: str | None = None,
+        limit: int = 100,
+    ) -> TaskChangesResponseSchema:
+        """
+        Возвращает задачи, созданные, измененные или удаленные после токена since,
+        в порядке (время изменения, ID), и токен для следующего запроса.
+
+        Изменения и удаления читаются по индексам (updated_at, id) и (deleted_at, id),
+        поэтому стоимость запроса зависит от объема изменений, а не от размера таблицы.
+        Изменения моложе SYNC_SETTLE_SECONDS не отдаются, чтобы не пропустить строки
+        транзакций, которые зафиксируются позже с более ранним временем изменения.
+
+        param since: Токен из предыдущего ответа, пусто - с самого начала.
+        param limit: Максимальное количество изменений в ответе.
+        return: Изменения, новый токен и признак наличия следующих изменений.
+        raises HTTPException: Если токен поврежден (400) или устарел (410).
+        """
+        limit = max(1, min(limit, settings.sync.SYNC_MAX_LIMIT))
+        position = decode_sync_token(since) if since else None
+        retention = timedelta(days=settings.sync.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if position is not None and position[0] < datetime.now(timezone.utc) - retention:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail='Токен синхронизации устарел, требуется полная синхронизация',
+            )
+
+        horizon = func.now() - timedelta(seconds=settings.sync.SYNC_SETTLE_SECONDS)
+        tasks_stmt = (
+            select(Task)
+            .where(Task.updated_at <= horizon)
+            .order_by(Task.updated_at, Task.id)
+            .limit(limit + 1)
+        )
+        tombstones_stmt = (
+            select(TaskTombstone)
+            .where(TaskTombstone.deleted_at <= horizon)
+            .order_by(TaskTombstone.deleted_at, TaskTombstone.id)
+            .limit(limit + 1)
+        )
+        if position is not None:
+            tasks_stmt = tasks_stmt.where(tuple_(Task.updated_at, Task.id) > position)
+            tombstones_stmt = tombstones_stmt.where(
+                tuple_(TaskTombstone.deleted_at, TaskTombstone.id) > position
+            )
+
+        tasks = (await session.execute(tasks_stmt)).scalars().all()
+        tombstones = (await session.execute(tombstones_stmt)).scalars().all()
+
+        # Слияние двух упорядоченных выборок в одну ленту изменений
+        changes = sorted(
+            [
+                TaskChangeSchema(op=TaskChangeOp.UPSERT, id=task.id, changed_at=task.updated_at, task=task)
+                for task in tasks
+            ] + [
+                TaskChangeSchema(op=TaskChangeOp.DELETE, id=tombstone.id, changed_at=tombstone.deleted_at)
+                for tombstone in tombstones
+            ],
+            key=lambda change: (change.changed_at, change.id),
+        )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        token = encode_sync_token(changes[-1].changed_at, changes[-1].id) if changes else (since or '')
+        return TaskChangesResponseSchema(
+            token=token,
+            has_more=has_more,
+            changes=changes,
+        )
+
+    @classmethod
+    async def purge_tombstones(
+        cls,
+        session: AsyncSession,
+        batch_size: int = 10_000,
+    ) -> int:
+        """
+        Удаляет отметки об удалении старше срока хранения небольшими пачками.
+
+        return: Количество удаленных отметок.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.sync.SYNC_TOMBSTONE_RETENTION_DAYS)
+        purged = 0
+        while True:
+            batch = (
+                select(TaskTombstone.id)
+                .where(TaskTombstone.deleted_at < cutoff)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await session.execute(delete(TaskTombstone).where(TaskTombstone.id.in_(batch)))
+            await session.commit()
+            purged += result.rowcount
+            if result.rowcount < batch_size:
+                return purged
+
     @classmethod
     async def create_task(
         cls,
@@ -109,6 +283,25 @@ class TaskCRUD:
                 detail='Возникла ошибка при создании задачи'
             )
 
+    @classmethod
+    def apply_update(
+        cls,
+        task: Task,
+        task_update: TaskUpdate | TaskUpdatePartial,
+        partial: bool = False,
+    ) -> Task:
+        """
+        Переносит значения из схемы обновления в задачу.
+
+        param partial: Переносить только явно переданные поля.
+        return: Обновленная задача.
+        """
+        for name, value in task_update.model_dump(exclude_unset=partial).items():
+            if name == 'status' and isinstance(value, str):
+                value = TaskStatus(task_update.status)
+            setattr(task, name, value)
+        return task
+
     @classmethod
     async def update_task(
         cls,
@@ -118,12 +311,8 @@ class TaskCRUD:
         partial: bool = False,
     ) -> Task | None:
         try:
-            for name, value in task_update.model_dump(exclude_unset=partial).items():
-                if name == 'status' and isinstance(value, str):
-                    value = TaskStatus(task_update.status)
-                setattr(task, name, value)
+            cls.apply_update(task=task, task_update=task_update, partial=partial)
             await session.commit()
-            await session.refresh(task)
             return task
         except IntegrityError:
             await session.rollback()
@@ -148,6 +337,8 @@ class TaskCRUD:
     ) -> None:
         try:
             await session.delete(task)
+            # Отметка об удалении для клиентов инкрементальной синхронизации
+            session.add(TaskTombstone(id=task.id))
             await session.commit()
         except IntegrityError:
             await session.rollback()
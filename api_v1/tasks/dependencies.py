@@ -13,7 +13,7 @@ async def task_by_id(
     """
     Получает задачу по ID.
 
-    param task_id: ID задачи, которую нужно получить.
+    param task_id: ID задачи (UUID в строковом виде), которую нужно получить.
     param session: Асинхронная сессия базы данных.
     return: Задача, если найдена.
     raises HTTPException: Если задача не найдена.
@@ -0,0 +1,168 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import AsyncIterator
+import uuid
+
+import asyncpg
+
+from core.config import settings
+from .crud import encode_sync_token
+
+import logging.config
+from core.logger import logger_config
+
+logging.config.dictConfig(logger_config)
+logger = logging.getLogger('app_logger')
+
+
+# Канал, в который триггер tasks_notify_change отправляет изменения задач
+CHANNEL = 'task_changes'
+
+RESYNC_FRAME = b'event: resync\ndata: {}\n\n'
+HEARTBEAT_FRAME = b': heartbeat\n\n'
+
+
+class FeedUnavailable(Exception):
+    pass
+
+
+class Subscriber:
+    """
+    Подписчик потока изменений с ограниченной очередью готовых SSE-кадров.
+
+    statuses - фильтр по статусу задачи, пустой - все изменения.
+    """
+
+    def __init__(self, statuses: frozenset[str], queue_size: int):
+        self.statuses = statuses
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def matches(self, statuses: set[str]) -> bool:
+        return not self.statuses or not self.statuses.isdisjoint(statuses)
+
+    def offer(self, frame: bytes) -> None:
+        """
+        Кладет кадр в очередь без ожидания. Если подписчик не успевает читать,
+        очередь очищается и в нее кладется единственное событие resync:
+        клиент дочитывает пропущенное через /api/v1/tasks/changes.
+        """
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(RESYNC_FRAME)
+
+    async def frames(self, heartbeat: float) -> AsyncIterator[bytes]:
+        """Отдает кадры до resync, а в паузах - комментарии heartbeat."""
+        while True:
+            try:
+                frame = await asyncio.wait_for(self.queue.get(), timeout=heartbeat)
+            except TimeoutError:
+                frame = HEARTBEAT_FRAME
+            yield frame
+            if frame is RESYNC_FRAME:
+                return
+
+
+class TaskFeedHub:
+    """
+    Раздает изменения задач подписчикам воркера.
+
+    На воркер открывается одно соединение LISTEN, каждое уведомление
+    разбирается и сериализуется в SSE-кадр один раз, после чего один и тот же
+    кадр раскладывается по очередям подходящих подписчиков.
+    Память на подписчика ограничена размером очереди.
+    """
+
+    def __init__(self, dsn: str, queue_size: int, max_subscribers: int, reconnect_delay: float):
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.reconnect_delay = reconnect_delay
+        self.subscribers: set[Subscriber] = set()
+        self.connected = asyncio.Event()
+
+    async def run(self) -> None:
+        """
+        Держит соединение LISTEN, переподключаясь при его потере.
+        Уведомления, пришедшие во время разрыва, потеряны,
+        поэтому после переподключения все подписчики получают resync.
+        """
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(CHANNEL, self._on_notify)
+                self.connected.set()
+                await lost.wait()
+                logger.warning('Соединение LISTEN %s потеряно', CHANNEL)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception('При подключении к каналу %s возникла ошибка: %s', CHANNEL, e)
+            finally:
+                self.connected.clear()
+                self._resync_all()
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+    def subscribe(self, statuses: set[str] | None = None) -> Subscriber:
+        """
+        raises FeedUnavailable: Если нет соединения LISTEN или достигнут лимит подписчиков.
+        """
+        if not self.connected.is_set() or len(self.subscribers) >= self.max_subscribers:
+            raise FeedUnavailable
+        subscriber = Subscriber(frozenset(statuses or ()), self.queue_size)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self.subscribers.discard(subscriber)
+
+    def publish(self, payload: str) -> None:
+        """
+        Раскладывает уведомление триггера по подписчикам.
+
+        payload: JSON с полями op, id, changed_at, status, old_status и task.
+        """
+        change = json.loads(payload)
+        # Подписчик на статус видит и задачи, которые из этого статуса ушли
+        statuses = {change.pop('status'), change.pop('old_status', None)}
+        changed_at = datetime.fromisoformat(change['changed_at'])
+        token = encode_sync_token(changed_at, uuid.UUID(change['id']))
+        frame = f'id: {token}\nevent: {change["op"]}\ndata: {json.dumps(change, ensure_ascii=False)}\n\n'.encode()
+        for subscriber in self.subscribers:
+            if subscriber.matches(statuses):
+                subscriber.offer(frame)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            self.publish(payload)
+        except Exception as e:
+            logger.exception('При разборе уведомления %s возникла ошибка: %s', channel, e)
+
+    def _resync_all(self) -> None:
+        for subscriber in self.subscribers:
+            subscriber.close()
+
+
+task_feed_hub = TaskFeedHub(
+    dsn=settings.db.dsn,
+    queue_size=settings.feed.FEED_QUEUE_SIZE,
+    max_subscribers=settings.feed.FEED_MAX_SUBSCRIBERS,
+    reconnect_delay=settings.feed.FEED_RECONNECT_SECONDS,
+)
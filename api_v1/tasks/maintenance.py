@@ -0,0 +1,26 @@
+import asyncio
+from core.config import settings
+from core.models import db_fastapi_connect
+from .crud import TaskCRUD
+
+import logging.config
+from core.logger import logger_config
+
+logging.config.dictConfig(logger_config)
+logger = logging.getLogger('crud_logger')
+
+
+async def purge_tombstones_periodically() -> None:
+    """
+    Периодически удаляет устаревшие отметки об удалении задач.
+    Ошибка одного прохода не останавливает цикл.
+    """
+    while True:
+        await asyncio.sleep(settings.sync.SYNC_PURGE_INTERVAL_SECONDS)
+        try:
+            async with db_fastapi_connect.session_factory() as session:
+                purged = await TaskCRUD.purge_tombstones(session=session)
+            if purged:
+                logger.info('Удалено устаревших отметок об удалении: %s', purged)
+        except Exception as e:
+            logger.exception('При очистке отметок об удалении возникла ошибка: %s', e)
@@ -1,7 +1,9 @@
 from pydantic import BaseModel, ConfigDict
 from typing import Annotated, List
 from annotated_types import MinLen, MaxLen
+from datetime import datetime
 from enum import Enum
+from uuid import UUID
 
 
 class TaskStatusEnum(str, Enum):
@@ -27,11 +29,26 @@ class TaskUpdatePartial(TaskUpdate):
 class SchemaTask(TaskUpdate):
     model_config = ConfigDict(from_attributes=True)
     
-    id: str
+    id: UUID
 
 class BaseTasksResponseSchema(BaseModel):
     pages_count: int
     total: int
 
 class TasksResponseSchema(BaseTasksResponseSchema):
-    tasks: List[SchemaTask]
\ No newline at end of file
+    tasks: List[SchemaTask]
+
+class TaskChangeOp(str, Enum):
+    UPSERT = 'upsert'
+    DELETE = 'delete'
+
+class TaskChangeSchema(BaseModel):
+    op: TaskChangeOp
+    id: UUID
+    changed_at: datetime
+    task: SchemaTask | None = None
+
+class TaskChangesResponseSchema(BaseModel):
+    token: str
+    has_more: bool
+    changes: List[TaskChangeSchema]
@@ -1,16 +1,22 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Path
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.models import db_fastapi_connect
 from .crud import TaskCRUD
 from .dependencies import task_by_id
+from .feed import FeedUnavailable, task_feed_hub
 from .schemas import (
     TaskCreate,
     SchemaTask,
     TaskUpdate,
     TaskUpdatePartial,
-    TasksResponseSchema
+    TasksResponseSchema,
+    TaskChangesResponseSchema,
+    TaskStatusEnum,
 )
+from core.config import settings
 
 router, router_list = APIRouter(tags=['Tasks']), APIRouter(tags=['Tasks'])
 
@@ -168,4 +174,73 @@ async def get_list_tasks(
         limit=limit,
         column_search=column_search,
         input_search=input_search,
-    )
\ No newline at end of file
+    )
+
+
+@router_list.get('/changes', response_model=TaskChangesResponseSchema, status_code=status.HTTP_200_OK)
+async def get_changes(
+    since: str | None = None,
+    limit: int = 100,
+    session: AsyncSession = Depends(db_fastapi_connect.scoped_session_dependency)
+):
+    """
+    Получает задачи, созданные, измененные или удаленные после токена синхронизации.
+
+    | Параметр      | Тип           | Описание                                          |
+    |---------------|---------------|---------------------------------------------------|
+    | since         | str           | Токен из предыдущего ответа, пусто - с начала.    |
+    | limit         | int           | Максимальное количество изменений в ответе.       |
+
+    Пока has_more равен true, следующий запрос можно делать сразу с новым токеном.
+
+    Возвращает:
+        TaskChangesResponseSchema: Изменения в порядке (changed_at, id) и новый токен. `200`
+
+    Исключения:
+        HTTPException: Токен поврежден `400` или устарел `410` - требуется полная синхронизация.
+    """
+    return await TaskCRUD.get_changes(
+        session=session,
+        since=since,
+        limit=limit,
+    )
+
+
+
+@router_list.get('/feed', response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def get_feed(
+    task_status: list[TaskStatusEnum] | None = Query(None, alias='status'),
+):
+    """
+    Поток изменений задач в формате Server-Sent Events.
+
+    | Параметр      | Тип           | Описание                                          |
+    |---------------|---------------|---------------------------------------------------|
+    | status        | list[str]     | Только задачи с этими статусами, можно повторять. |
+
+    События upsert и delete содержат те же данные, что и /changes,
+    а их id - токен синхронизации. Событие resync означает, что часть изменений
+    пропущена (клиент не успевал читать или поток переподключался к базе):
+    поток закрывается, клиент дочитывает изменения через /changes с последним id.
+
+    Возвращает:
+        StreamingResponse: Поток text/event-stream. `200`
+
+    Исключения:
+        HTTPException: Поток недоступен или достигнут лимит подписчиков. `503`
+    """
+    try:
+        subscriber = task_feed_hub.subscribe({item.value for item in task_status or ()})
+    except FeedUnavailable:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Поток изменений временно недоступен',
+            headers={'Retry-After': str(int(settings.feed.FEED_RECONNECT_SECONDS) + 1)},
+        )
+    return StreamingResponse(
+        subscriber.frames(heartbeat=settings.feed.FEED_HEARTBEAT_SECONDS),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        # Выполняется и при отключении клиента
+        background=BackgroundTask(task_feed_hub.unsubscribe, subscriber),
+    )
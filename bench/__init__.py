@@ -0,0 +1,20 @@
+"""
+Нагрузочное тестирование API менеджера задач.
+
+Использование:
+  python -m bench seed --tasks 100000          - наполнить базу тестовыми задачами
+  python -m bench run --start-app              - запустить приложение и прогнать сценарии
+  python -m bench run --base-url http://...    - прогнать сценарии против запущенного приложения
+  python -m bench compare old.json new.json    - сравнить результаты двух прогонов
+  python -m bench micro                        - микробенчмарки с проверкой регрессий
+  python -m bench micro --save-baseline        - сохранить текущие замеры как базовый уровень
+
+Структура:
+- bench/
+  - client.py     - минимальный асинхронный HTTP/1.1 клиент с keep-alive
+  - scenarios.py  - сценарии нагрузки по эндпоинтам
+  - seed.py       - наполнение базы данных
+  - runner.py     - генератор нагрузки, статистика и отчеты
+  - micro.py      - микробенчмарки CRUD, сериализации и логирования
+  - baselines/    - сохраненные базовые уровни микробенчмарков
+"""
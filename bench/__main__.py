@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import sys
+
+from core.config import settings
+
+from . import micro, runner, seed
+from .scenarios import SCENARIOS
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m bench', description='Нагрузочное тестирование API задач')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = commands.add_parser('seed', help='Наполнить базу тестовыми задачами')
+    seed_parser.add_argument('--tasks', type=int, default=10_000, help='Количество задач (10k-10M)')
+    seed_parser.add_argument('--batch-size', type=int, default=50_000)
+    seed_parser.add_argument('--truncate', action='store_true', help='Очистить таблицу перед наполнением')
+
+    run_parser = commands.add_parser('run', help='Прогнать сценарии нагрузки')
+    run_parser.add_argument('--base-url', default=None, help='Адрес уже запущенного приложения')
+    run_parser.add_argument('--start-app', action='store_true', help='Запустить приложение локально через uvicorn')
+    run_parser.add_argument('--port', type=int, default=8765, help='Порт для --start-app')
+    run_parser.add_argument('--workers', type=int, default=1, help='Количество воркеров uvicorn для --start-app')
+    run_parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='Сценарии через запятую')
+    run_parser.add_argument('--concurrency', type=int, default=32)
+    run_parser.add_argument('--duration', type=float, default=10.0, help='Длительность замера сценария, с')
+    run_parser.add_argument('--warmup', type=float, default=2.0, help='Прогрев перед замером, с')
+    run_parser.add_argument('--seed', type=int, default=42, help='Зерно генератора случайных чисел')
+    run_parser.add_argument('--limit', type=int, default=10, help='Размер страницы списка')
+    run_parser.add_argument('--sample-size', type=int, default=10_000, help='Размер выборки ID для get/put/patch')
+    run_parser.add_argument('--output', default=None, help='Файл результатов (по умолчанию bench/results/)')
+
+    compare_parser = commands.add_parser('compare', help='Сравнить результаты двух прогонов')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=10.0, help='Допустимое ухудшение, %%')
+
+    micro_parser = commands.add_parser('micro', help='Микробенчмарки горячих путей')
+    micro_parser.add_argument('--filter', default=None, help='Запускать только бенчмарки, содержащие подстроку')
+    micro_parser.add_argument('--repeat', type=int, default=7, help='Количество серий замера')
+    micro_parser.add_argument('--save-baseline', action='store_true', help='Сохранить замеры как базовый уровень')
+    micro_parser.add_argument('--tolerance', type=float, default=0.25, help='Допустимое замедление (0.25 - на 25%%)')
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+
+    if args.command == 'seed':
+        asyncio.run(seed.seed(args.tasks, args.batch_size, args.truncate))
+        return 0
+
+    if args.command == 'compare':
+        return runner.compare(args.old, args.new, args.threshold)
+
+    if args.command == 'micro':
+        results = micro.run(args.filter, args.repeat)
+        if args.save_baseline:
+            micro.save_baseline(results)
+            print(f'Базовый уровень сохранен в {micro.BASELINE_PATH}')
+            return 0
+        return micro.check(results, args.tolerance)
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        print(f'Неизвестные сценарии: {", ".join(sorted(unknown))}', file=sys.stderr)
+        return 2
+
+    app = None
+    base_url = args.base_url or f'http://127.0.0.1:{settings.api_v1_port}'
+    if args.start_app:
+        base_url = f'http://127.0.0.1:{args.port}'
+        app = runner.start_app(args.port, args.workers)
+    try:
+        results = asyncio.run(runner.run(
+            base_url=base_url,
+            scenarios=scenarios,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            warmup=args.warmup,
+            seed=args.seed,
+            limit=args.limit,
+            sample_size=args.sample_size,
+        ))
+    finally:
+        if app is not None:
+            app.terminate()
+            app.wait()
+    path = runner.write_results(results, args.output)
+    print(f'Результаты записаны в {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
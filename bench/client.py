@@ -0,0 +1,113 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+
+class HttpResponse:
+    __slots__ = ('status', 'headers', 'body')
+
+    def __init__(self, status: int, headers: dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class HttpConnection:
+    """
+    Минимальный HTTP/1.1 клиент с keep-alive поверх asyncio streams.
+
+    Используется вместо полноценных клиентов, чтобы накладные расходы
+    генератора нагрузки были минимальными и не искажали замеры.
+    Одно соединение обслуживает один запрос за раз.
+    """
+
+    def __init__(self, base_url: str):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or 80
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+        self._reader = self._writer = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        payload: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        """
+        Выполняет запрос, при разрыве соединения переподключается один раз.
+
+        param method: HTTP метод.
+        param path: Путь запроса вместе с query string.
+        param payload: Тело запроса, сериализуется в JSON.
+        param headers: Дополнительные заголовки.
+        return: Ответ сервера.
+        """
+        body = json.dumps(payload).encode() if payload is not None else b''
+        head = [
+            f'{method} {path} HTTP/1.1',
+            f'Host: {self.host}:{self.port}',
+            f'Content-Length: {len(body)}',
+        ]
+        if payload is not None:
+            head.append('Content-Type: application/json')
+        for name, value in (headers or {}).items():
+            head.append(f'{name}: {value}')
+        raw = ('\r\n'.join(head) + '\r\n\r\n').encode('utf-8') + body
+
+        for attempt in (1, 2):
+            if self._writer is None:
+                await self._connect()
+            try:
+                self._writer.write(raw)
+                return await self._read_response()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if attempt == 2:
+                    raise
+
+    async def _read_response(self) -> HttpResponse:
+        head = await self._reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split(' ', 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = await self._read_chunked()
+        else:
+            length = int(headers.get('content-length', 0))
+            body = await self._reader.readexactly(length) if length else b''
+
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return HttpResponse(status, headers, body)
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self._reader.readuntil(b'\r\n')).split(b';')[0], 16)
+            if size == 0:
+                await self._reader.readuntil(b'\r\n')
+                return b''.join(chunks)
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readexactly(2)
@@ -0,0 +1,164 @@
+import json
+import logging
+import platform
+import timeit
+import uuid
+from pathlib import Path
+from typing import Callable
+
+
+BASELINE_PATH = Path(__file__).parent / 'baselines' / 'micro.json'
+
+# Фабрика бенчмарка готовит данные и возвращает измеряемую функцию без аргументов,
+# так что подготовка не попадает в замер.
+BenchmarkFactory = Callable[[], Callable[[], object]]
+BENCHMARKS: dict[str, BenchmarkFactory] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    def register(factory: BenchmarkFactory) -> BenchmarkFactory:
+        BENCHMARKS[name] = factory
+        return factory
+    return register
+
+
+def _tasks(count: int) -> list:
+    from core.models import Task
+    from core.models.task import TaskStatus
+
+    return [
+        Task(
+            id=uuid.UUID(f'00000000-0000-7000-8000-{index:012d}'),
+            title=f'Task {index}',
+            description=f'Description {index}' * 5,
+            status=TaskStatus.CREATED,
+        )
+        for index in range(count)
+    ]
+
+
+@benchmark('crud.build_tasks_statements.default')
+def bench_build_default():
+    from api_v1.tasks.crud import TaskCRUD
+
+    return lambda: TaskCRUD.build_tasks_statements()
+
+
+@benchmark('crud.build_tasks_statements.search')
+def bench_build_search():
+    from api_v1.tasks.crud import TaskCRUD
+
+    return lambda: TaskCRUD.build_tasks_statements(
+        column='description',
+        sort='asc',
+        page=3,
+        limit=50,
+        column_search='status',
+        input_search='in_progress',
+    )
+
+
+@benchmark('schemas.SchemaTask.validate')
+def bench_schema_task():
+    from api_v1.tasks.schemas import SchemaTask
+
+    task = _tasks(1)[0]
+    return lambda: SchemaTask.model_validate(task)
+
+
+@benchmark('schemas.TasksResponseSchema.100_rows')
+def bench_tasks_response():
+    from api_v1.tasks.schemas import TasksResponseSchema
+
+    tasks = _tasks(100)
+    return lambda: TasksResponseSchema(pages_count=10, total=1000, tasks=tasks)
+
+
+@benchmark('crud.apply_update.partial')
+def bench_apply_update():
+    from api_v1.tasks.crud import TaskCRUD
+    from api_v1.tasks.schemas import TaskUpdatePartial
+
+    task = _tasks(1)[0]
+    task_update = TaskUpdatePartial(description='Updated', status='in_progress')
+    return lambda: TaskCRUD.apply_update(task=task, task_update=task_update, partial=True)
+
+
+@benchmark('logger.CustomJsonFormatter.format')
+def bench_json_formatter():
+    from core.logger import CustomJsonFormatter
+
+    formatter = CustomJsonFormatter()
+    record = logging.LogRecord(
+        name='crud_logger',
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg='При обновлении задачи: %s, возникла ошибка: %s',
+        args=('00000000-0000-7000-8000-000000000000', 'timeout'),
+        exc_info=None,
+    )
+    record.service = 'crud'
+    return lambda: formatter.format(record)
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """
+    Замеряет время одного вызова в наносекундах.
+
+    Количество вызовов в серии подбирается автоматически (~0.2 с),
+    из repeat серий берется минимум как наименее зашумленная оценка.
+    """
+    timer = timeit.Timer(function)
+    # Прогрев: первые вызовы заполняют кэши и не отражают установившийся режим
+    timer.timeit(number=100)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(name_filter: str | None = None, repeat: int = 7) -> dict[str, float]:
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = round(measure(factory(), repeat), 1)
+        print(f'{name:<45} {results[name]:>12.1f} нс/вызов', flush=True)
+    return results
+
+
+def save_baseline(results: dict[str, float], path: Path = BASELINE_PATH) -> None:
+    baseline = load_baseline(path)
+    baseline['meta'] = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+    }
+    baseline.setdefault('benchmarks', {}).update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, ensure_ascii=False, indent=2, sort_keys=True) + '\n')
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def check(results: dict[str, float], tolerance: float, path: Path = BASELINE_PATH) -> int:
+    """
+    Сравнивает замеры с сохраненным базовым уровнем.
+
+    param tolerance: Допустимое замедление в долях (0.25 - на 25%).
+    return: Код возврата: 1, если хотя бы один горячий путь замедлился сильнее допуска.
+    """
+    baseline = load_baseline(path).get('benchmarks', {})
+    regressions = 0
+    for name, value in results.items():
+        if name not in baseline:
+            print(f'{name:<45} нет базового уровня')
+            continue
+        ratio = value / baseline[name]
+        regressed = ratio > 1 + tolerance
+        regressions += regressed
+        print(f'{name:<45} {baseline[name]:>10.1f} -> {value:>10.1f} нс (x{ratio:.2f})'
+              f'{"  РЕГРЕССИЯ" if regressed else ""}')
+    return 1 if regressions else 0
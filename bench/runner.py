@@ -0,0 +1,221 @@
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .client import HttpConnection
+from .scenarios import SCENARIOS, BenchContext
+from .seed import count_tasks, sample_ids
+
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+
+def percentile(values: list[float], p: float) -> float:
+    """
+    Перцентиль по методу ближайшего ранга.
+
+    param values: Отсортированный список значений.
+    param p: Перцентиль от 0 до 100.
+    return: Значение перцентиля или 0 для пустого списка.
+    """
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * p // 100))
+    return values[int(rank) - 1]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'mean_ms': round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'max_ms': round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+async def run_scenario(
+    name: str,
+    ctx: BenchContext,
+    base_url: str,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> dict:
+    """
+    Прогоняет один сценарий по замкнутой модели: concurrency воркеров,
+    каждый на своем соединении, отправляет следующий запрос сразу
+    после ответа на предыдущий. Запросы периода прогрева не учитываются.
+    """
+    factory = SCENARIOS[name]
+    latencies: list[float] = []
+    errors = 0
+    started = time.perf_counter()
+    measure_from = started + warmup
+    deadline = measure_from + duration
+
+    async def worker(index: int) -> None:
+        nonlocal errors
+        rnd = random.Random(f'{seed}:{name}:{index}')
+        connection = HttpConnection(base_url)
+        try:
+            while time.perf_counter() < deadline:
+                request = factory(ctx, rnd)
+                if request is None:
+                    return
+                method, path, payload = request
+                sent = time.perf_counter()
+                try:
+                    response = await connection.request(method, path, payload)
+                    failed = response.status >= 400
+                except Exception:
+                    response, failed = None, True
+                latency_ms = (time.perf_counter() - sent) * 1000
+                if name == 'create' and response is not None and response.status == 201:
+                    ctx.created_ids.append(response.json()['id'])
+                if sent >= measure_from:
+                    latencies.append(latency_ms)
+                    errors += failed
+        finally:
+            await connection.close()
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = min(time.perf_counter(), deadline) - measure_from
+    return summarize(latencies, errors, elapsed)
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+async def wait_ready(base_url: str, timeout: float = 60) -> None:
+    connection = HttpConnection(base_url)
+    deadline = time.perf_counter() + timeout
+    try:
+        while time.perf_counter() < deadline:
+            try:
+                if (await connection.request('GET', '/health/ready')).status == 200:
+                    return
+            except OSError:
+                await connection.close()
+            await asyncio.sleep(0.5)
+    finally:
+        await connection.close()
+    raise TimeoutError(f'Приложение {base_url} не стало готовым за {timeout} с')
+
+
+def start_app(port: int, workers: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, '-m', 'uvicorn', 'main:app',
+            '--host', '127.0.0.1', '--port', str(port),
+            '--workers', str(workers), '--log-level', 'warning',
+            '--no-access-log',
+        ],
+        env=os.environ.copy(),
+    )
+
+
+async def run(
+    base_url: str,
+    scenarios: list[str],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+    limit: int,
+    sample_size: int,
+) -> dict:
+    """
+    Прогоняет сценарии по очереди и собирает результаты.
+
+    return: Результаты в машиночитаемом виде.
+    """
+    await wait_ready(base_url)
+    ctx = BenchContext(
+        ids=await sample_ids(sample_size),
+        total=await count_tasks(),
+        limit=limit,
+    )
+    if not ctx.ids:
+        raise RuntimeError('В базе нет задач, сначала выполните: python -m bench seed')
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'git_revision': git_revision(),
+            'base_url': base_url,
+            'dataset_size': ctx.total,
+            'concurrency': concurrency,
+            'duration_s': duration,
+            'warmup_s': warmup,
+            'seed': seed,
+            'limit': limit,
+        },
+        'scenarios': {},
+    }
+    for name in scenarios:
+        summary = await run_scenario(name, ctx, base_url, concurrency, duration, warmup, seed)
+        results['scenarios'][name] = summary
+        print(
+            f'{name:<10} {summary["rps"]:>10.1f} req/s  '
+            f'p50 {summary["p50_ms"]:>8.2f} ms  p95 {summary["p95_ms"]:>8.2f} ms  '
+            f'p99 {summary["p99_ms"]:>8.2f} ms  ошибок {summary["errors"]}',
+            flush=True,
+        )
+    return results
+
+
+def write_results(results: dict, output: str | None) -> Path:
+    if output:
+        path = Path(output)
+    else:
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        path = RESULTS_DIR / f'{stamp}-{results["meta"]["git_revision"] or "local"}.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+    return path
+
+
+def compare(old_path: str, new_path: str, threshold: float) -> int:
+    """
+    Сравнивает два прогона по req/s и p95.
+
+    param threshold: Допустимое ухудшение в процентах.
+    return: Код возврата: 1, если есть регрессия больше порога.
+    """
+    old = json.loads(Path(old_path).read_text())['scenarios']
+    new = json.loads(Path(new_path).read_text())['scenarios']
+    regressions = 0
+    print(f'{"сценарий":<10} {"req/s":>22} {"p95, ms":>24}')
+    for name in [name for name in old if name in new]:
+        rps_delta = _delta(old[name]['rps'], new[name]['rps'])
+        p95_delta = _delta(old[name]['p95_ms'], new[name]['p95_ms'])
+        regressed = rps_delta < -threshold or p95_delta > threshold
+        regressions += regressed
+        print(
+            f'{name:<10} {old[name]["rps"]:>9.1f} -> {new[name]["rps"]:>9.1f} ({rps_delta:+6.1f}%)'
+            f' {old[name]["p95_ms"]:>8.2f} -> {new[name]["p95_ms"]:>8.2f} ({p95_delta:+6.1f}%)'
+            f'{"  РЕГРЕССИЯ" if regressed else ""}'
+        )
+    return 1 if regressions else 0
+
+
+def _delta(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
@@ -0,0 +1,92 @@
+import random
+from dataclasses import dataclass, field
+from typing import Callable
+
+from core.config import settings
+
+
+API = settings.api_v1_prefix
+STATUSES = ('created', 'in_progress', 'completed')
+
+
+@dataclass
+class BenchContext:
+    """
+    Общие данные сценариев: выборка существующих ID,
+    ID созданных в ходе прогона задач и размер набора данных.
+    """
+    ids: list[str]
+    total: int
+    limit: int = 10
+    created_ids: list[str] = field(default_factory=list)
+
+
+# Сценарий возвращает (метод, путь, тело) очередного запроса
+# или None, если запросы для сценария закончились.
+RequestFactory = Callable[[BenchContext, random.Random], tuple[str, str, dict | None] | None]
+
+
+def _task_payload(rnd: random.Random) -> dict:
+    number = rnd.randrange(1_000_000)
+    return {
+        'title': f'Bench Task {number}',
+        'description': f'Bench description {number}',
+    }
+
+
+def create(ctx: BenchContext, rnd: random.Random):
+    return 'POST', f'{API}/task/create', _task_payload(rnd)
+
+
+def get(ctx: BenchContext, rnd: random.Random):
+    return 'GET', f'{API}/task/{rnd.choice(ctx.ids)}/', None
+
+
+def put(ctx: BenchContext, rnd: random.Random):
+    payload = _task_payload(rnd)
+    payload['status'] = rnd.choice(STATUSES)
+    return 'PUT', f'{API}/task/{rnd.choice(ctx.ids)}/', payload
+
+
+def patch(ctx: BenchContext, rnd: random.Random):
+    return 'PATCH', f'{API}/task/{rnd.choice(ctx.ids)}/', {'status': rnd.choice(STATUSES)}
+
+
+def delete(ctx: BenchContext, rnd: random.Random):
+    # Удаляем только задачи, созданные сценарием create,
+    # чтобы не менять исходный набор данных
+    if not ctx.created_ids:
+        return None
+    return 'DELETE', f'{API}/task/{ctx.created_ids.pop()}/', None
+
+
+def list_page(ctx: BenchContext, rnd: random.Random):
+    return 'GET', f'{API}/tasks/?page=1&limit={ctx.limit}', None
+
+
+def search(ctx: BenchContext, rnd: random.Random):
+    column, value = rnd.choice((
+        ('title', f'Bench Task {rnd.randrange(1, 100)}'),
+        ('description', f'Bench description {rnd.choice("0123456789abcdef")}'),
+        ('status', rnd.choice(STATUSES)),
+    ))
+    return 'GET', f'{API}/tasks/?column_search={column}&input_search={value.replace(" ", "%20")}&limit={ctx.limit}', None
+
+
+def deep_page(ctx: BenchContext, rnd: random.Random):
+    pages = max(1, ctx.total // ctx.limit)
+    page = rnd.randint(max(1, pages * 9 // 10), pages)
+    return 'GET', f'{API}/tasks/?page={page}&limit={ctx.limit}', None
+
+
+# Порядок важен: delete удаляет задачи, созданные сценарием create
+SCENARIOS: dict[str, RequestFactory] = {
+    'create': create,
+    'get': get,
+    'put': put,
+    'patch': patch,
+    'list': list_page,
+    'search': search,
+    'deep_page': deep_page,
+    'delete': delete,
+}
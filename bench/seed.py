@@ -0,0 +1,80 @@
+import time
+import asyncpg
+
+from core.config import settings
+
+
+# Содержимое задач детерминировано номером строки, поэтому
+# наборы данных одного размера одинаковы между прогонами.
+# ID генерируются как UUIDv7 (время в мс + случайные биты), как и в приложении.
+SEED_SQL = """
+INSERT INTO tasks (id, title, description, status)
+SELECT
+    encode(set_bit(set_bit(overlay(
+        uuid_send(gen_random_uuid())
+        placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+        FROM 1 FOR 6
+    ), 52, 1), 53, 1), 'hex')::uuid,
+    'Bench Task ' || g,
+    'Bench description ' || md5(g::text),
+    (ARRAY['CREATED', 'IN_PROGRESS', 'COMPLETED'])[1 + g % 3]::task_status_enum
+FROM generate_series($1::bigint, $2::bigint) AS g
+"""
+
+
+async def seed(tasks: int, batch_size: int = 50_000, truncate: bool = False) -> None:
+    """
+    Наполняет таблицу tasks тестовыми задачами пачками по batch_size строк.
+
+    Каждая пачка - отдельная короткая транзакция, чтобы наполнение
+    десятков миллионов строк не держало одну длинную транзакцию.
+
+    param tasks: Итоговое количество задач, которые нужно добавить.
+    param batch_size: Размер пачки.
+    param truncate: Очистить таблицу перед наполнением.
+    """
+    connection = await asyncpg.connect(settings.db.dsn)
+    try:
+        if truncate:
+            await connection.execute('TRUNCATE tasks')
+        started = time.perf_counter()
+        for start in range(1, tasks + 1, batch_size):
+            end = min(start + batch_size - 1, tasks)
+            await connection.execute(SEED_SQL, start, end)
+            print(f'  наполнено {end}/{tasks} задач', flush=True)
+        await connection.execute('ANALYZE tasks')
+        print(f'Наполнение заняло {time.perf_counter() - started:.1f} с')
+    finally:
+        await connection.close()
+
+
+async def count_tasks() -> int:
+    connection = await asyncpg.connect(settings.db.dsn)
+    try:
+        return await connection.fetchval('SELECT count(*) FROM tasks')
+    finally:
+        await connection.close()
+
+
+async def sample_ids(limit: int) -> list[str]:
+    """
+    Возвращает выборку существующих ID задач без полного сканирования таблицы.
+
+    param limit: Размер выборки.
+    return: Список ID в виде строк.
+    """
+    connection = await asyncpg.connect(settings.db.dsn)
+    try:
+        total = await connection.fetchval(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = 'tasks'"
+        )
+        if not total or total <= limit * 10:
+            rows = await connection.fetch('SELECT id FROM tasks LIMIT $1', limit)
+        else:
+            percent = min(100.0, limit * 200.0 / total)
+            rows = await connection.fetch(
+                f'SELECT id FROM tasks TABLESAMPLE SYSTEM ({percent}) LIMIT $1', limit
+            )
+        return [str(row['id']) for row in rows]
+    finally:
+        await connection.close()
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import math
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.metrics import registry
+
+
+admitted_total = registry.counter(
+    'admission_admitted_total', 'Запросы, допущенные к базе данных', ('route_class',)
+)
+rejected_total = registry.counter(
+    'admission_rejected_total', 'Запросы, отклоненные с 503', ('route_class', 'reason')
+)
+in_flight = registry.gauge(
+    'admission_in_flight', 'Запросы, выполняющиеся с соединением из пула', ('route_class',)
+)
+queue_depth = registry.gauge(
+    'admission_queue_depth', 'Запросы, ожидающие допуска', ('route_class',)
+)
+limit_gauge = registry.gauge(
+    'admission_limit', 'Лимит одновременных запросов', ('route_class',)
+)
+
+READ_METHODS = frozenset({'GET', 'HEAD'})
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionGate:
+    """
+    Ограничивает число одновременных запросов одного класса.
+
+    Сверх лимита в очереди ждут не больше queue_size запросов и не дольше
+    timeout секунд; остальные отклоняются сразу, пока пул еще успевает
+    обслуживать допущенные запросы.
+    """
+
+    def __init__(self, route_class: str, limit: int, queue_size: int, timeout: float):
+        self.route_class = route_class
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.waiting = 0
+        self.semaphore = asyncio.Semaphore(limit)
+        limit_gauge.set(limit, route_class=route_class)
+
+    async def acquire(self) -> None:
+        """
+        raises AdmissionRejected: Если очередь заполнена (queue_full)
+            или допуск не получен за timeout (timeout).
+        """
+        if self.semaphore.locked():
+            if self.waiting >= self.queue_size:
+                rejected_total.inc(route_class=self.route_class, reason='queue_full')
+                raise AdmissionRejected('queue_full')
+            self.waiting += 1
+            queue_depth.set(self.waiting, route_class=self.route_class)
+            try:
+                await asyncio.wait_for(self.semaphore.acquire(), timeout=self.timeout)
+            except TimeoutError:
+                rejected_total.inc(route_class=self.route_class, reason='timeout')
+                raise AdmissionRejected('timeout')
+            finally:
+                self.waiting -= 1
+                queue_depth.set(self.waiting, route_class=self.route_class)
+        else:
+            await self.semaphore.acquire()
+        admitted_total.inc(route_class=self.route_class)
+        in_flight.inc(route_class=self.route_class)
+
+    def release(self) -> None:
+        in_flight.dec(route_class=self.route_class)
+        self.semaphore.release()
+
+
+def split_pool_capacity(capacity: int, read_share: float) -> tuple[int, int]:
+    """
+    Делит емкость пула (pool_size + max_overflow) между чтением и записью
+    так, чтобы допущенные запросы не ждали соединение внутри пула.
+
+    return: Лимиты (чтение, запись), каждый не меньше 1.
+    """
+    reads = max(1, min(capacity - 1, math.floor(capacity * read_share)))
+    return reads, max(1, capacity - reads)
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware допуска запросов к базе данных.
+
+    Запросы к prefix делятся на чтение (GET, HEAD) и запись, у каждого
+    класса свой лимит. Пути из exclude (например, долгоживущий поток
+    изменений, который не держит соединение из пула) не ограничиваются.
+    Отклоненный запрос получает 503 с Retry-After.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        prefix: str,
+        read_limit: int,
+        write_limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        retry_after: int,
+        exclude: tuple[str, ...] = (),
+    ):
+        self.app = app
+        self.prefix = prefix
+        self.exclude = exclude
+        self.retry_after = retry_after
+        self.gates = {
+            'read': AdmissionGate('read', read_limit, queue_size, queue_timeout),
+            'write': AdmissionGate('write', write_limit, queue_size, queue_timeout),
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get('path', '')
+        if scope['type'] != 'http' or not path.startswith(self.prefix) or path.startswith(self.exclude):
+            await self.app(scope, receive, send)
+            return
+
+        gate = self.gates['read' if scope['method'] in READ_METHODS else 'write']
+        try:
+            await gate.acquire()
+        except AdmissionRejected:
+            # Без записи в лог: при перегрузке отказов много, их считает метрика
+            await self.reject(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+    async def reject(self, send: Send) -> None:
+        body = json.dumps(
+            {'detail': 'Сервер перегружен, повторите запрос позже'}, ensure_ascii=False
+        ).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': 503,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+                (b'retry-after', str(self.retry_after).encode()),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
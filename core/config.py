@@ -19,10 +19,24 @@ class ConfigurationDB(BaseModel):
     DB_PORT: int = os.getenv('DB_PORT', 5432)
     DB_NAME: str = os.getenv('DB_NAME')
     
+    # Пул соединений
+    DB_POOL_SIZE: int = os.getenv('DB_POOL_SIZE', 5)
+    DB_MAX_OVERFLOW: int = os.getenv('DB_MAX_OVERFLOW', 10)
+    DB_POOL_TIMEOUT: float = os.getenv('DB_POOL_TIMEOUT', 30)
+    
+    # Прогрев пула при старте приложения
+    DB_WARMUP_CONNECTIONS: int = os.getenv('DB_WARMUP_CONNECTIONS', 5)
+    DB_WARMUP_STATEMENT_TIMEOUT: int = os.getenv('DB_WARMUP_STATEMENT_TIMEOUT', 1000)  # мс
+    
     @property
     def async_url(self):
         return f'postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}'
     
+    @property
+    def dsn(self):
+        # Адрес для прямого подключения asyncpg, в обход SQLAlchemy
+        return f'postgresql://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}'
+    
     echo: bool = False
 
 
@@ -48,6 +62,42 @@ class ConfigurationCORS(BaseModel):
         'Access-Control-Allow-Origin',
     ]
 
+class ConfigurationSync(BaseModel):
+    #########################
+    #   Синхронизация задач #
+    #########################
+    # Сколько хранятся отметки об удалении; более старый токен требует полной синхронизации
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = os.getenv('SYNC_TOMBSTONE_RETENTION_DAYS', 30)
+    # Изменения моложе этого окна не отдаются, чтобы не пропустить
+    # строки транзакций, которые начались раньше, а зафиксировались позже
+    SYNC_SETTLE_SECONDS: float = os.getenv('SYNC_SETTLE_SECONDS', 2)
+    SYNC_MAX_LIMIT: int = os.getenv('SYNC_MAX_LIMIT', 1000)
+    # Период очистки устаревших отметок об удалении
+    SYNC_PURGE_INTERVAL_SECONDS: int = os.getenv('SYNC_PURGE_INTERVAL_SECONDS', 3600)
+
+class ConfigurationFeed(BaseModel):
+    #########################
+    #   Поток изменений     #
+    #########################
+    # Размер очереди подписчика: отстающий подписчик отключается
+    # с событием resync, а не копит события в памяти
+    FEED_QUEUE_SIZE: int = os.getenv('FEED_QUEUE_SIZE', 256)
+    FEED_MAX_SUBSCRIBERS: int = os.getenv('FEED_MAX_SUBSCRIBERS', 1000)
+    FEED_HEARTBEAT_SECONDS: float = os.getenv('FEED_HEARTBEAT_SECONDS', 15)
+    FEED_RECONNECT_SECONDS: float = os.getenv('FEED_RECONNECT_SECONDS', 1)
+
+class ConfigurationAdmission(BaseModel):
+    #########################
+    #   Допуск запросов     #
+    #########################
+    ADMISSION_ENABLED: bool = os.getenv('ADMISSION_ENABLED', True)
+    # Доля емкости пула (DB_POOL_SIZE + DB_MAX_OVERFLOW) для чтения, остальное - запись
+    ADMISSION_READ_SHARE: float = os.getenv('ADMISSION_READ_SHARE', 0.7)
+    # Сколько запросов каждого класса могут ждать допуска и как долго, с
+    ADMISSION_QUEUE_SIZE: int = os.getenv('ADMISSION_QUEUE_SIZE', 64)
+    ADMISSION_QUEUE_TIMEOUT: float = os.getenv('ADMISSION_QUEUE_TIMEOUT', 0.5)
+    ADMISSION_RETRY_AFTER: int = os.getenv('ADMISSION_RETRY_AFTER', 1)
+
 class ConfigurationLoki(BaseModel):
     #########################
     #         Loki          #
@@ -72,5 +122,14 @@ class Setting(BaseSettings):
     # CORS
     cors: ConfigurationCORS = ConfigurationCORS()
     
+    # SYNC
+    sync: ConfigurationSync = ConfigurationSync()
+    
+    # FEED
+    feed: ConfigurationFeed = ConfigurationFeed()
+    
+    # ADMISSION
+    admission: ConfigurationAdmission = ConfigurationAdmission()
+    
 
 settings = Setting()
\ No newline at end of file
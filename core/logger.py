@@ -58,6 +58,10 @@ logger_config = {
             '()': 'core.logger.ServiceNameFilter',
             'service_name': 'uvicorn'
         },
+        'app': {
+            '()': 'core.logger.ServiceNameFilter',
+            'service_name': 'app'
+        },
     },
     'handlers': {
         'console': {
@@ -77,6 +81,12 @@ logger_config = {
             'propagate': False,
             'filters': ['crud'],
         },
+        'app_logger': {
+            'level': 'INFO',
+            'handlers': ['console'],
+            'propagate': False,
+            'filters': ['app'],
+        },
         'uvicorn': {
             'handlers': ['console'],
             'level': 'INFO',
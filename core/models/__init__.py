@@ -2,10 +2,12 @@ __all__ = (
     'Base',
     'db_fastapi_connect',
     'Task',
+    'TaskTombstone',
 )
 
 from .base import Base
 from .db_connect import (
     db_fastapi_connect,
 )
-from .task import Task
\ No newline at end of file
+from .task import Task
+from .task_tombstone import TaskTombstone
\ No newline at end of file
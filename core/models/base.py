@@ -1,8 +1,26 @@
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, declared_attr
-from sqlalchemy import String
+from sqlalchemy import Uuid
+import os
+import time
 import uuid
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Генерирует UUID версии 7 (RFC 9562).
+
+    Старшие 48 бит - время в миллисекундах, остальные - случайные.
+    Новые ключи растут во времени, поэтому вставки попадают в конец
+    B-дерева первичного ключа, а не в случайные страницы.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    # версия 7 и вариант RFC 9562
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     __abstract__ = True
 
@@ -10,6 +28,6 @@ class Base(DeclarativeBase):
     def __tablename__(cls) -> str:
         return f'{cls.__name__.lower()}s'
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     
 
@@ -1,5 +1,11 @@
+import asyncio
 from asyncio import current_task
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
@@ -10,10 +16,20 @@ from core.config import settings
 
 
 class DatabaseFastapiConnect:
-    def __init__(self, url: str, echo: bool = False):
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+    ):
         self.engine = create_async_engine(
             url=url,
             echo=echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
@@ -36,9 +52,69 @@ class DatabaseFastapiConnect:
         finally:
             await session.close()
 
+    async def warmup(
+        self,
+        connections: int,
+        statement_timeout: int,
+        callback: Callable[[AsyncSession], Awaitable[None]] | None = None,
+    ) -> None:
+        """
+        Прогревает пул соединений.
+
+        Одновременно открывает connections соединений (не больше размера пула),
+        чтобы asyncpg заранее выполнил подключение и интроспекцию типов,
+        и на каждом из них вызывает callback, который прогоняет горячие запросы.
+        Запросы выполняются в откатываемой транзакции с ограничением
+        statement_timeout: подготовленный statement остается в кэше соединения,
+        даже если сам запрос на большой таблице не успел выполниться.
+
+        param connections: Количество соединений для прогрева.
+        param statement_timeout: Ограничение времени запроса при прогреве, мс.
+        param callback: Корутина, выполняющая горячие запросы в сессии.
+        """
+        connections = min(connections, self.engine.pool.size())
+        if connections <= 0:
+            return
+
+        async with AsyncExitStack() as stack:
+            opened: list[AsyncConnection] = await asyncio.gather(*(
+                stack.enter_async_context(self.engine.connect())
+                for _ in range(connections)
+            ), return_exceptions=True)
+            for connection in opened:
+                if isinstance(connection, BaseException):
+                    raise connection
+            await asyncio.gather(*(
+                self._warmup_connection(connection, statement_timeout, callback)
+                for connection in opened
+            ))
+
+    @staticmethod
+    async def _warmup_connection(
+        connection: AsyncConnection,
+        statement_timeout: int,
+        callback: Callable[[AsyncSession], Awaitable[None]] | None,
+    ) -> None:
+        await connection.execute(text(f'SET LOCAL statement_timeout = {int(statement_timeout)}'))
+        if callback is not None:
+            async with AsyncSession(bind=connection) as session:
+                try:
+                    await callback(session)
+                except Exception:
+                    # Превышение statement_timeout не мешает прогреву:
+                    # запрос уже разобран и подготовлен на соединении.
+                    pass
+        await connection.rollback()
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+
 db_fastapi_connect = DatabaseFastapiConnect(
     url=settings.db.async_url,
     echo=settings.db.echo,
+    pool_size=settings.db.DB_POOL_SIZE,
+    max_overflow=settings.db.DB_MAX_OVERFLOW,
+    pool_timeout=settings.db.DB_POOL_TIMEOUT,
 )
 
 
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Enum as PgEnum
+from sqlalchemy import String, Index, DateTime, func, Enum as PgEnum
+from datetime import datetime
 from enum import Enum
 
 from .base import Base
@@ -11,10 +12,27 @@ class TaskStatus(Enum):
 
 class Task(Base):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Сортировка списка по title/description без отдельного шага Sort
+        Index('ix_tasks_title', 'title'),
+        Index('ix_tasks_description', 'description'),
+        # Фильтр по статусу с сортировкой по умолчанию (title)
+        Index('ix_tasks_status_title', 'status', 'title'),
+        # Поиск по префиксу (LIKE 'значение%') при collation, отличной от C
+        Index('ix_tasks_title_pattern', 'title', postgresql_ops={'title': 'varchar_pattern_ops'}),
+        Index('ix_tasks_description_pattern', 'description', postgresql_ops={'description': 'varchar_pattern_ops'}),
+        # Выборка изменений по ключу (updated_at, id) для синхронизации
+        Index('ix_tasks_updated_at_id', 'updated_at', 'id'),
+    )
+    # created_at/updated_at заполняются базой и возвращаются через RETURNING
+    # того же INSERT/UPDATE, без дополнительного запроса
+    __mapper_args__ = {'eager_defaults': True}
 
     title: Mapped[str] = mapped_column(String(100))
     description: Mapped[str | None] = mapped_column(String(255))
     status: Mapped[TaskStatus] = mapped_column(PgEnum(TaskStatus, name='task_status_enum'), default=TaskStatus.CREATED)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
     
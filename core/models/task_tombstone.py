@@ -0,0 +1,17 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Index, func
+from datetime import datetime
+
+from .base import Base
+
+class TaskTombstone(Base):
+    """
+    Отметка об удалении задачи для инкрементальной синхронизации.
+    id совпадает с ID удаленной задачи.
+    """
+    __tablename__ = 'task_tombstones'
+    __table_args__ = (
+        Index('ix_task_tombstones_deleted_at_id', 'deleted_at', 'id'),
+    )
+
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
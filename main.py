@@ -1,21 +1,70 @@
+import asyncio
 import uvicorn
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.docs import get_swagger_ui_html
 from core.config import settings
+from core.admission import AdmissionMiddleware, split_pool_capacity
+from core.metrics import registry, CONTENT_TYPE
+from core.models import db_fastapi_connect
 from api_v1 import router as router_v1
+from api_v1.tasks.crud import TaskCRUD
+from api_v1.tasks.maintenance import purge_tombstones_periodically
+from api_v1.tasks.feed import task_feed_hub
 
 import logging.config
 from core.logger import logger_config
 
 logging.config.dictConfig(logger_config)
+logger = logging.getLogger('app_logger')
+
+
+async def warmup(app: FastAPI) -> None:
+    """
+    Прогревает пул соединений и горячие запросы TaskCRUD,
+    после чего помечает приложение готовым к приему трафика.
+    """
+    try:
+        await db_fastapi_connect.warmup(
+            connections=settings.db.DB_WARMUP_CONNECTIONS,
+            statement_timeout=settings.db.DB_WARMUP_STATEMENT_TIMEOUT,
+            callback=TaskCRUD.warmup,
+        )
+        logger.info('Прогрев пула соединений завершен')
+    except Exception as e:
+        logger.exception('При прогреве пула соединений возникла ошибка: %s', e)
+    finally:
+        app.state.ready = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+    # Схема OpenAPI кэшируется в app.openapi_schema
+    app.openapi()
+    background_tasks = [
+        asyncio.create_task(warmup(app)),
+        asyncio.create_task(purge_tombstones_periodically()),
+        asyncio.create_task(task_feed_hub.run()),
+    ]
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        await db_fastapi_connect.dispose()
+
 
 app = FastAPI(
     title='API Manager Tasks',
     description='Простой менеджер задач на FastAPI с использованием асинхронного драйвера для SQLAlchemy и базы данных PostgreSQL',
     version='1.0.0',
+    lifespan=lifespan,
     # docs_url=None,
     # redoc_url=None,
 )
@@ -30,6 +79,40 @@ async def custom_swagger_ui_html():
         swagger_css_url='/static/swagger-custom-ui.css',
     )
 
+@app.get('/health/live', include_in_schema=False)
+async def health_live():
+    return {'status': 'alive'}
+
+@app.get('/health/ready', include_in_schema=False)
+async def health_ready():
+    if getattr(app.state, 'ready', False):
+        return {'status': 'ready'}
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={'status': 'warming_up'},
+    )
+
+@app.get('/metrics', include_in_schema=False)
+async def metrics():
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+if settings.admission.ADMISSION_ENABLED:
+    read_limit, write_limit = split_pool_capacity(
+        capacity=settings.db.DB_POOL_SIZE + settings.db.DB_MAX_OVERFLOW,
+        read_share=settings.admission.ADMISSION_READ_SHARE,
+    )
+    app.add_middleware(
+        AdmissionMiddleware,
+        prefix=settings.api_v1_prefix,
+        read_limit=read_limit,
+        write_limit=write_limit,
+        queue_size=settings.admission.ADMISSION_QUEUE_SIZE,
+        queue_timeout=settings.admission.ADMISSION_QUEUE_TIMEOUT,
+        retry_after=settings.admission.ADMISSION_RETRY_AFTER,
+        # Поток изменений не держит соединение из пула
+        exclude=(f'{settings.api_v1_prefix}/tasks/feed',),
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors.origins,
@@ -42,4 +125,4 @@ app.include_router(router=router_v1, prefix=settings.api_v1_prefix)
 
 
 if __name__ == '__main__':
-    uvicorn.run('main:app', host='0.0.0.0', port=settings.api_v1_port, reload=True)
\ No newline at end of file
+    uvicorn.run('main:app', host='0.0.0.0', port=settings.api_v1_port, reload=True)
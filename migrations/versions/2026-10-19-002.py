@@ -0,0 +1,60 @@
+"""Task list and search indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, Sequence[str], None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    ("ix_tasks_title", ["title"], None),
+    ("ix_tasks_description", ["description"], None),
+    ("ix_tasks_status_title", ["status", "title"], None),
+    ("ix_tasks_title_pattern", ["title"], {"title": "varchar_pattern_ops"}),
+    (
+        "ix_tasks_description_pattern",
+        ["description"],
+        {"description": "varchar_pattern_ops"},
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY не блокирует запись в tasks,
+    # но не может выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        for name, columns, ops in INDEXES:
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                unique=False,
+                postgresql_ops=ops or {},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
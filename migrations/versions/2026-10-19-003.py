@@ -0,0 +1,139 @@
+"""Native UUID primary key for tasks
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+import time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, Sequence[str], None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 10_000
+# пауза между пачками, чтобы не забивать WAL и реплики
+BATCH_PAUSE = 0.05
+LOCK_TIMEOUT = "5s"
+
+
+def backfill() -> None:
+    """Заполняет id_new пачками, каждая пачка - отдельная транзакция."""
+    if op.get_context().as_sql:
+        op.execute("UPDATE tasks SET id_new = id::uuid WHERE id_new IS NULL")
+        return
+
+    bind = op.get_bind()
+    last_id = ""
+    while True:
+        # Пачка выбирается по первичному ключу, поэтому каждая следующая
+        # не сканирует уже обработанную часть таблицы
+        last_id = bind.execute(
+            sa.text(
+                """
+                WITH batch AS (
+                    SELECT id FROM tasks
+                    WHERE id > :last_id
+                    ORDER BY id
+                    LIMIT :batch_size
+                ), updated AS (
+                    UPDATE tasks SET id_new = tasks.id::uuid
+                    FROM batch
+                    WHERE tasks.id = batch.id AND tasks.id_new IS NULL
+                )
+                SELECT max(id) FROM batch
+                """
+            ),
+            {"last_id": last_id, "batch_size": BATCH_SIZE},
+        ).scalar()
+        if last_id is None:
+            break
+        time.sleep(BATCH_PAUSE)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. Новая колонка и триггер, который заполняет ее для новых
+    #    и изменяемых строк, пока идет перенос существующих
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    op.execute("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS id_new uuid")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tasks_sync_id_new() RETURNS trigger AS $$
+        BEGIN
+            NEW.id_new := NEW.id::uuid;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS tasks_sync_id_new ON tasks")
+    op.execute(
+        "CREATE TRIGGER tasks_sync_id_new BEFORE INSERT OR UPDATE OF id "
+        "ON tasks FOR EACH ROW EXECUTE FUNCTION tasks_sync_id_new()"
+    )
+
+    with op.get_context().autocommit_block():
+        # 2. Перенос существующих строк короткими транзакциями
+        backfill()
+        # 3. Уникальный индекс без блокировки записи
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS tasks_id_new_key "
+            "ON tasks (id_new)"
+        )
+        # 4. NOT NULL через проверенный CHECK: VALIDATE не блокирует запись,
+        #    а SET NOT NULL затем не сканирует таблицу под эксклюзивной блокировкой
+        op.execute(
+            """
+            DO $$
+            BEGIN
+                ALTER TABLE tasks ADD CONSTRAINT tasks_id_new_not_null
+                    CHECK (id_new IS NOT NULL) NOT VALID;
+            EXCEPTION WHEN duplicate_object THEN NULL;
+            END
+            $$
+            """
+        )
+        op.execute(
+            "ALTER TABLE tasks VALIDATE CONSTRAINT tasks_id_new_not_null"
+        )
+
+    # 5. Короткая транзакция: подмена колонки и первичного ключа,
+    #    удаление дублирующего индекса ix_tasks_id
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    op.execute("ALTER TABLE tasks ALTER COLUMN id_new SET NOT NULL")
+    op.execute("ALTER TABLE tasks DROP CONSTRAINT tasks_id_new_not_null")
+    op.execute("DROP TRIGGER tasks_sync_id_new ON tasks")
+    op.execute("DROP FUNCTION tasks_sync_id_new()")
+    op.execute("ALTER TABLE tasks DROP CONSTRAINT tasks_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_tasks_id")
+    op.execute("ALTER TABLE tasks DROP COLUMN id")
+    op.execute("ALTER TABLE tasks RENAME COLUMN id_new TO id")
+    op.execute("ALTER INDEX tasks_id_new_key RENAME TO tasks_pkey")
+    op.execute(
+        "ALTER TABLE tasks ADD CONSTRAINT tasks_pkey "
+        "PRIMARY KEY USING INDEX tasks_pkey"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Обратное преобразование переписывает таблицу целиком
+    op.alter_column(
+        "tasks",
+        "id",
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        postgresql_using="id::text",
+        existing_nullable=False,
+    )
+    op.create_index(op.f("ix_tasks_id"), "tasks", ["id"], unique=False)
@@ -0,0 +1,91 @@
+"""Task timestamps and tombstones for incremental sync
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, Sequence[str], None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LOCK_TIMEOUT = "5s"
+
+INDEXES = (
+    ("ix_tasks_created_at", ["created_at"]),
+    ("ix_tasks_updated_at_id", ["updated_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Колонки с постоянным значением по умолчанию добавляются без
+    # перезаписи таблицы: now() вычисляется один раз для всех
+    # существующих строк
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    for column in ("created_at", "updated_at"):
+        op.add_column(
+            "tasks",
+            sa.Column(
+                column,
+                sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+        )
+    op.create_table(
+        "task_tombstones",
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_task_tombstones_deleted_at_id",
+        "task_tombstones",
+        ["deleted_at", "id"],
+        unique=False,
+    )
+
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.drop_index(
+        "ix_task_tombstones_deleted_at_id", table_name="task_tombstones"
+    )
+    op.drop_table("task_tombstones")
+    op.drop_column("tasks", "updated_at")
+    op.drop_column("tasks", "created_at")
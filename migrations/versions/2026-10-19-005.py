@@ -0,0 +1,73 @@
+"""Notify task changes for the live feed
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, Sequence[str], None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LOCK_TIMEOUT = "5s"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Уведомление отправляется при фиксации транзакции и укладывается
+    # в лимит NOTIFY (8000 байт): title и description ограничены длиной
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tasks_notify_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('task_changes', json_build_object(
+                    'op', 'delete',
+                    'id', OLD.id,
+                    'changed_at', now(),
+                    'status', lower(OLD.status::text),
+                    'task', NULL
+                )::text);
+                RETURN OLD;
+            END IF;
+            PERFORM pg_notify('task_changes', json_build_object(
+                'op', 'upsert',
+                'id', NEW.id,
+                'changed_at', NEW.updated_at,
+                'status', lower(NEW.status::text),
+                'old_status', CASE WHEN TG_OP = 'UPDATE'
+                    THEN lower(OLD.status::text) END,
+                'task', json_build_object(
+                    'id', NEW.id,
+                    'title', NEW.title,
+                    'description', NEW.description,
+                    'status', lower(NEW.status::text)
+                )
+            )::text);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    op.execute(
+        "CREATE TRIGGER tasks_notify_change "
+        "AFTER INSERT OR UPDATE OR DELETE ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION tasks_notify_change()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS tasks_notify_change ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS tasks_notify_change()")
@@ -21,9 +21,8 @@ echo "Выполнение миграций..."
 cd /app
 export PYTHONPATH=/app
 
-# Удаляем старые миграции и создаем новые
-rm -rf /app/migrations/versions/*
-poetry run alembic revision --autogenerate -m 'Initial'
+# Применяем те же миграции, что и в рабочей базе: часть из них
+# написана вручную (перенос данных, триггеры) и не восстанавливается автогенерацией
 poetry run alembic upgrade head
 
 echo "Инициализация базы данных завершена!"
@@ -5,6 +5,7 @@
 - tests/
   - crud/         - тесты CRUD операций
   - api/          - тесты API эндпоинтов
+  - sql/          - тесты количества SQL запросов и планов запросов
   - conftest.py   - фикстуры для тестов
 """
 __version__ = "0.1.0"
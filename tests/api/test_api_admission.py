@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from fastapi import status
+from core.admission import AdmissionMiddleware, rejected_total, split_pool_capacity
+
+
+class TestAdmission:
+    """
+    Тесты допуска запросов к базе данных и сброса избыточной нагрузки.
+    """
+
+    @staticmethod
+    def middleware(app, **kwargs):
+        options = dict(
+            prefix='/api/v1', read_limit=1, write_limit=1,
+            queue_size=1, queue_timeout=0.2, retry_after=3,
+        ) | kwargs
+        return AdmissionMiddleware(app, **options)
+
+    @staticmethod
+    async def call(middleware, method='GET', path='/api/v1/tasks/'):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {'type': 'http', 'method': method, 'path': path}
+        await middleware(scope, None, send)
+        return messages[0]['status'] if messages else None, dict(messages[0]['headers']) if messages else {}
+
+    @pytest.mark.asyncio
+    async def test_split_pool_capacity(self):
+        assert split_pool_capacity(15, 0.7) == (10, 5)
+        assert split_pool_capacity(1, 0.7) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_queue_full_and_timeout(self):
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await release.wait()
+            await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+
+        middleware = self.middleware(app)
+        before = rejected_total.get(route_class='read', reason='queue_full')
+        running = asyncio.create_task(self.call(middleware))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(self.call(middleware))
+        await asyncio.sleep(0)
+
+        # Лимит занят, место в очереди занято - отказ без ожидания
+        code, headers = await self.call(middleware)
+        assert code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert headers[b'retry-after'] == b'3'
+        assert rejected_total.get(route_class='read', reason='queue_full') == before + 1
+
+        # Запрос из очереди не дождался допуска за queue_timeout
+        assert (await queued)[0] == status.HTTP_503_SERVICE_UNAVAILABLE
+        release.set()
+        assert (await running)[0] == status.HTTP_200_OK
+
+    @pytest.mark.asyncio
+    async def test_reads_and_writes_limited_separately(self):
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            if scope['method'] == 'GET':
+                await release.wait()
+            await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+
+        middleware = self.middleware(app, queue_size=0)
+        running = asyncio.create_task(self.call(middleware))
+        await asyncio.sleep(0)
+        assert (await self.call(middleware, method='POST'))[0] == status.HTTP_200_OK
+        assert (await self.call(middleware))[0] == status.HTTP_503_SERVICE_UNAVAILABLE
+        # Пути вне prefix и исключения не ограничиваются
+        assert (await self.call(middleware, path='/health/ready'))[0] == status.HTTP_200_OK
+        release.set()
+        await running
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self, client):
+        response = client.get('/metrics')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers['content-type'].startswith('text/plain')
+        assert 'admission_limit{route_class="read"}' in response.text
+        assert 'admission_rejected_total' in response.text
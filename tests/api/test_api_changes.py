@@ -0,0 +1,77 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from fastapi import status
+from core.config import settings
+from api_v1.tasks.crud import encode_sync_token
+
+
+class TestTaskChangesAPI:
+    """
+    Тесты инкрементальной синхронизации задач.
+
+    Клиент получает только созданные, измененные и удаленные
+    после токена задачи и новый токен для следующего запроса.
+    """
+
+    @pytest.fixture(autouse=True)
+    def no_settle(self, monkeypatch):
+        monkeypatch.setattr(settings.sync, 'SYNC_SETTLE_SECONDS', 0)
+
+    @staticmethod
+    def sync(client, token=None, limit=1000):
+        """Дочитывает изменения до конца и возвращает их вместе с новым токеном."""
+        changes = []
+        while True:
+            params = {'limit': limit} | ({'since': token} if token else {})
+            response = client.get('/api/v1/tasks/changes', params=params)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            changes += data['changes']
+            token = data['token']
+            if not data['has_more']:
+                return changes, token
+
+    @pytest.mark.asyncio
+    async def test_changes_since_token(self, client):
+        _, token = self.sync(client)
+
+        created = client.post('/api/v1/task/create', json={'title': 'Sync Task'}).json()
+        changes, token = self.sync(client, token)
+        assert [(c['op'], c['id']) for c in changes] == [('upsert', created['id'])]
+        assert changes[0]['task']['title'] == 'Sync Task'
+
+        # Без новых изменений ответ пустой, а токен не меняется
+        changes, same_token = self.sync(client, token)
+        assert changes == []
+        assert same_token == token
+
+        client.patch(f"/api/v1/task/{created['id']}/", json={'status': 'completed'})
+        changes, token = self.sync(client, token)
+        assert [(c['op'], c['id']) for c in changes] == [('upsert', created['id'])]
+        assert changes[0]['task']['status'] == 'completed'
+
+        client.delete(f"/api/v1/task/{created['id']}/")
+        changes, token = self.sync(client, token)
+        assert [(c['op'], c['id'], c['task']) for c in changes] == [('delete', created['id'], None)]
+
+    @pytest.mark.asyncio
+    async def test_changes_keyset_pages(self, client):
+        _, token = self.sync(client)
+        created = [
+            client.post('/api/v1/task/create', json={'title': f'Sync Page {i}'}).json()['id']
+            for i in range(5)
+        ]
+        changes, _ = self.sync(client, token, limit=2)
+        assert [c['id'] for c in changes] == created
+
+    @pytest.mark.asyncio
+    async def test_changes_invalid_token(self, client):
+        response = client.get('/api/v1/tasks/changes', params={'since': 'not a token'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_changes_expired_token(self, client):
+        expired = datetime.now(timezone.utc) - timedelta(days=settings.sync.SYNC_TOMBSTONE_RETENTION_DAYS + 1)
+        response = client.get('/api/v1/tasks/changes', params={'since': encode_sync_token(expired, uuid4())})
+        assert response.status_code == status.HTTP_410_GONE
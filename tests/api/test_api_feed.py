@@ -0,0 +1,61 @@
+import asyncio
+import json
+import pytest
+from fastapi import status
+from core.config import settings
+from api_v1.tasks.feed import RESYNC_FRAME, Subscriber, TaskFeedHub, task_feed_hub
+
+
+class TestTaskFeed:
+    """
+    Тесты потока изменений задач через LISTEN/NOTIFY.
+    """
+
+    @pytest.fixture
+    async def hub(self):
+        hub = TaskFeedHub(dsn=settings.db.dsn, queue_size=16, max_subscribers=10, reconnect_delay=0.1)
+        task = asyncio.create_task(hub.run())
+        await asyncio.wait_for(hub.connected.wait(), timeout=5)
+        yield hub
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    @staticmethod
+    async def next_event(subscriber):
+        frame = await asyncio.wait_for(subscriber.queue.get(), timeout=5)
+        lines = dict(line.split(': ', 1) for line in frame.decode().strip().split('\n'))
+        return lines['event'], json.loads(lines['data'])
+
+    @pytest.mark.asyncio
+    async def test_feed_filters_by_status(self, client, hub):
+        everything = hub.subscribe()
+        completed = hub.subscribe({'completed'})
+
+        task = client.post('/api/v1/task/create', json={'title': 'Feed Task'}).json()
+        client.patch(f"/api/v1/task/{task['id']}/", json={'status': 'completed'})
+        client.delete(f"/api/v1/task/{task['id']}/")
+
+        event, data = await self.next_event(everything)
+        assert (event, data['id'], data['task']['status']) == ('upsert', task['id'], 'created')
+        # Подписчик на completed не получает создание задачи в статусе created
+        for subscriber in (everything, completed):
+            event, data = await self.next_event(subscriber)
+            assert (event, data['id'], data['task']['status']) == ('upsert', task['id'], 'completed')
+            event, data = await self.next_event(subscriber)
+            assert (event, data['id'], data['task']) == ('delete', task['id'], None)
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_gets_resync(self):
+        subscriber = Subscriber(frozenset(), queue_size=2)
+        for index in range(3):
+            subscriber.offer(f'data: {index}\n\n'.encode())
+        # Очередь не растет: накопленные кадры заменены одним resync
+        assert subscriber.closed
+        assert [frame async for frame in subscriber.frames(heartbeat=1)] == [RESYNC_FRAME]
+
+    @pytest.mark.asyncio
+    async def test_feed_subscribers_limit(self, client, monkeypatch):
+        monkeypatch.setattr(task_feed_hub, 'max_subscribers', 0)
+        response = client.get('/api/v1/tasks/feed')
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert 'retry-after' in response.headers
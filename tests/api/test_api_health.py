@@ -0,0 +1,34 @@
+import time
+import pytest
+from fastapi import status
+from main import app
+
+
+class TestHealthAPI:
+    """
+    Тесты для проверок живости и готовности приложения.
+    """
+
+    @pytest.mark.asyncio
+    async def test_live(self, client):
+        response = client.get('/health/live')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['status'] == 'alive'
+
+    @pytest.mark.asyncio
+    async def test_ready_after_warmup(self, client):
+        # Прогрев идет в фоне, ждем его завершения
+        for _ in range(50):
+            response = client.get('/health/ready')
+            if response.status_code == status.HTTP_200_OK:
+                break
+            assert response.json()['status'] == 'warming_up'
+            time.sleep(0.1)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['status'] == 'ready'
+
+    @pytest.mark.asyncio
+    async def test_openapi_pregenerated(self, client):
+        assert app.openapi_schema is not None
+        response = client.get('/openapi.json')
+        assert response.status_code == status.HTTP_200_OK
@@ -1,3 +1,4 @@
+import uuid
 import pytest
 from fastapi import status
 
@@ -39,6 +40,16 @@ class TestTaskAPI:
         assert data_response_task["description"] == test_create_task["description"]
         assert data_response_task["status"] == test_create_task["status"]
     
+    @pytest.mark.asyncio
+    async def test_get_task_id_formats(self, client, test_create_task):
+        task_id = uuid.UUID(test_create_task['id'])
+        # ID генерируются как UUIDv7, упорядоченные по времени
+        assert task_id.version == 7
+        for raw_id in (str(task_id).upper(), task_id.hex):
+            response = client.get(f"/api/v1/task/{raw_id}")
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["id"] == test_create_task["id"]
+
     @pytest.mark.asyncio
     async def test_update_task(self, client, test_create_task):
         assert test_create_task is not None
@@ -92,6 +92,7 @@ class TestTaskCRUDErrors:
     async def test_delete_task_integrity_error(self):
         mock_session = AsyncMock()
         mock_session.commit.side_effect = IntegrityError("Integrity Error", {}, None)
+        mock_session.add = MagicMock()
         
         task_id = str(uuid4())
         task = SchemaTask(id=task_id, title="Test", description="Test", status="created")
@@ -107,6 +108,7 @@ class TestTaskCRUDErrors:
     async def test_delete_task_general_error(self):
         mock_session = AsyncMock()
         mock_session.commit.side_effect = Exception("Unexpected error")
+        mock_session.add = MagicMock()
         
         task_id = str(uuid4())
         task = SchemaTask(id=task_id, title="Test", description="Test", status="created")
@@ -0,0 +1,47 @@
+import time
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.models import db_fastapi_connect
+from main import app
+
+
+class QueryCounter:
+    """
+    Собирает все SQL запросы, отправленные через движок,
+    с помощью события before_cursor_execute.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine.sync_engine
+        self.statements: list[str] = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements.clear()
+        event.listen(self.engine, 'before_cursor_execute', self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._on_execute)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def kinds(self) -> list[str]:
+        return [statement.split(None, 1)[0].upper() for statement in self.statements]
+
+
+@pytest.fixture
+def sql_queries(client):
+    # Дожидаемся окончания фонового прогрева, чтобы его запросы не попали в замер
+    for _ in range(100):
+        if getattr(app.state, 'ready', False):
+            break
+        time.sleep(0.05)
+    return QueryCounter(db_fastapi_connect.engine)
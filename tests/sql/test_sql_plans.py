@@ -0,0 +1,115 @@
+import json
+import uuid
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from api_v1.tasks.crud import TaskCRUD
+from core.config import settings
+from core.models import Task
+
+
+SEED_ROWS = 5000
+
+SEED_SQL = text("""
+INSERT INTO tasks (id, title, description, status)
+SELECT
+    gen_random_uuid(),
+    'Plan Task ' || g,
+    'Plan description ' || md5(g::text),
+    (ARRAY['CREATED', 'IN_PROGRESS', 'COMPLETED'])[1 + g % 3]::task_status_enum
+FROM generate_series(1, :rows) AS g
+""")
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+def list_stmt(**kwargs):
+    return TaskCRUD.build_tasks_statements(**kwargs)[0]
+
+
+def count_stmt(**kwargs):
+    return TaskCRUD.build_tasks_statements(**kwargs)[1]
+
+
+# (название, запрос, запрещенные узлы плана, колонка, которая должна быть в Index Cond).
+# Для поиска по префиксу используются селективные значения: для частых префиксов
+# планировщик вправе обойти индекс сортировки с фильтром и остановиться на LIMIT.
+CASES = [
+    ('get_by_id', select(Task).where(Task.id == uuid.UUID(int=0)), {'Seq Scan'}, 'id'),
+    ('list_title_desc', list_stmt(), {'Seq Scan', 'Sort', 'Incremental Sort'}, None),
+    ('list_title_asc', list_stmt(sort='asc'), {'Seq Scan', 'Sort', 'Incremental Sort'}, None),
+    ('list_description_desc', list_stmt(column='description'), {'Seq Scan', 'Sort', 'Incremental Sort'}, None),
+    ('list_description_asc', list_stmt(column='description', sort='asc'), {'Seq Scan', 'Sort', 'Incremental Sort'}, None),
+    ('list_deep_page', list_stmt(page=400, limit=10), {'Seq Scan', 'Sort', 'Incremental Sort'}, None),
+    (
+        'search_status',
+        list_stmt(column_search='status', input_search='in_progress'),
+        {'Seq Scan', 'Sort', 'Incremental Sort'},
+        'status',
+    ),
+    ('count_status', count_stmt(column_search='status', input_search='completed'), {'Seq Scan'}, 'status'),
+    ('search_title', list_stmt(column_search='title', input_search='Plan Task 123'), {'Seq Scan'}, 'title'),
+    ('count_title', count_stmt(column_search='title', input_search='Plan Task 123'), {'Seq Scan'}, 'title'),
+    (
+        'search_description',
+        list_stmt(column_search='description', input_search='Plan description abc'),
+        {'Seq Scan'},
+        'description',
+    ),
+]
+
+
+@pytest.fixture
+async def seeded_connection():
+    """
+    Соединение с транзакцией, в которой таблица наполнена данными
+    и собрана статистика. Транзакция откатывается после теста.
+    """
+    engine = create_async_engine(settings.db.async_url, poolclass=NullPool)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        await connection.execute(SEED_SQL, {'rows': SEED_ROWS})
+        await connection.execute(text('ANALYZE tasks'))
+        # Запрещаем Seq Scan и Sort: если они все же есть в плане,
+        # значит подходящего индекса нет
+        await connection.execute(text('SET LOCAL enable_seqscan = off'))
+        yield connection
+        await transaction.rollback()
+    await engine.dispose()
+
+
+class TestSQLQueryPlans:
+    """
+    Тесты планов запросов списка и поиска на наполненной таблице.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'name, stmt, forbidden, index_column',
+        CASES,
+        ids=[case[0] for case in CASES],
+    )
+    async def test_query_plan(self, seeded_connection, name, stmt, forbidden, index_column):
+        if 'Sort' in forbidden:
+            await seeded_connection.execute(text('SET LOCAL enable_sort = off'))
+        sql = stmt.compile(
+            dialect=seeded_connection.dialect,
+            compile_kwargs={'literal_binds': True},
+        )
+        result = await seeded_connection.execute(text(f'EXPLAIN (FORMAT JSON) {sql}'))
+        raw = result.scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]['Plan']
+        nodes = list(plan_nodes(plan))
+
+        found = {node['Node Type'] for node in nodes} & forbidden
+        assert not found, f'{name}: в плане есть {found}\n{json.dumps(plan, indent=2)}'
+        if index_column:
+            assert any(
+                index_column in node.get('Index Cond', '') for node in nodes
+            ), f'{name}: условие по {index_column} не использует индекс\n{json.dumps(plan, indent=2)}'
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import status
+
+
+class TestSQLQueryCount:
+    """
+    Тесты количества SQL запросов на каждый эндпоинт api_v1/tasks/views.py.
+
+    Лишний запрос (например, refresh() после commit) меняет количество
+    и сразу роняет тест.
+    """
+
+    @pytest.fixture
+    def task(self, client):
+        response = client.post('/api/v1/task/create', json={'title': 'SQL Count Task'})
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    @pytest.mark.asyncio
+    async def test_create_task(self, client, sql_queries):
+        with sql_queries:
+            response = client.post('/api/v1/task/create', json={'title': 'SQL Count Task'})
+        assert response.status_code == status.HTTP_201_CREATED
+        assert sql_queries.kinds == ['INSERT']
+
+    @pytest.mark.asyncio
+    async def test_get_task(self, client, task, sql_queries):
+        with sql_queries:
+            response = client.get(f"/api/v1/task/{task['id']}/")
+        assert response.status_code == status.HTTP_200_OK
+        assert sql_queries.kinds == ['SELECT']
+
+    @pytest.mark.asyncio
+    async def test_get_task_not_found(self, client, sql_queries):
+        with sql_queries:
+            response = client.get('/api/v1/task/00000000-0000-0000-0000-000000000000/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert sql_queries.kinds == ['SELECT']
+
+    @pytest.mark.asyncio
+    async def test_get_task_invalid_id(self, client, sql_queries):
+        with sql_queries:
+            response = client.get('/api/v1/task/invalid_id/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        # ID, который не является UUID, отсекается без обращения к базе
+        assert sql_queries.count == 0
+
+    @pytest.mark.asyncio
+    async def test_update_task(self, client, task, sql_queries):
+        with sql_queries:
+            response = client.put(f"/api/v1/task/{task['id']}/", json={
+                'title': 'SQL Count Updated',
+                'description': None,
+                'status': 'in_progress',
+            })
+        assert response.status_code == status.HTTP_200_OK
+        assert sql_queries.kinds == ['SELECT', 'UPDATE']
+
+    @pytest.mark.asyncio
+    async def test_update_partial_task(self, client, task, sql_queries):
+        with sql_queries:
+            response = client.patch(f"/api/v1/task/{task['id']}/", json={'status': 'completed'})
+        assert response.status_code == status.HTTP_200_OK
+        assert sql_queries.kinds == ['SELECT', 'UPDATE']
+
+    @pytest.mark.asyncio
+    async def test_delete_task(self, client, task, sql_queries):
+        with sql_queries:
+            response = client.delete(f"/api/v1/task/{task['id']}/")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        # DELETE и отметка об удалении для синхронизации
+        assert sql_queries.kinds == ['SELECT', 'INSERT', 'DELETE']
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('query', [
+        '',
+        '?page=3&limit=5&column=description&sort=asc',
+        '?column_search=title&input_search=SQL',
+        '?column_search=description&input_search=SQL',
+        '?column_search=status&input_search=completed',
+    ])
+    async def test_get_list_tasks(self, client, sql_queries, query):
+        with sql_queries:
+            response = client.get(f'/api/v1/tasks/{query}')
+        assert response.status_code == status.HTTP_200_OK
+        # COUNT для total и выборка страницы
+        assert sql_queries.count == 2